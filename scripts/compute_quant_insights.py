@@ -6,11 +6,27 @@ from __future__ import annotations
 import argparse
 import json
 import math
-import statistics
+import mmap
+import os
+import zipfile
 from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime, timezone
+from itertools import repeat
 from pathlib import Path
-from typing import Dict, Iterable, List, Optional, Tuple
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+
+try:
+    import orjson
+except ImportError:  # optional: falls back to the stdlib parser
+    orjson = None
+
+try:
+    from numba import njit
+except ImportError:  # optional: kernels fall back to NumPy implementations
+    njit = None
 
 UTC = timezone.utc
 DATA_DIR = Path("data")
@@ -18,93 +34,222 @@ HIST_DIR = DATA_DIR / "daily_histories"
 COMMON_COINS_PATH = DATA_DIR / "common_coins.json"
 OUTPUT_DIR = DATA_DIR / "analytics"
 OUTPUT_PATH = OUTPUT_DIR / "quant_insights.json"
+CACHE_DIR = OUTPUT_DIR / "_cache"
+# Bump when the metric definitions change so stale cache entries are ignored.
+CACHE_VERSION = 1
 PRIMARY_EXCHANGE_ORDER = ["binance", "coinbase", "okx", "bybit", "upbit"]
+ROLLING_DRAWDOWN_DAYS = 30
+
+# Per-exchange column arrays, e.g. {"binance": {"timestamp_ms": ..., "close": ...}}.
+CoinSeries = Dict[str, Dict[str, np.ndarray]]
+
+
+def read_json(path: Path) -> object:
+    raw = path.read_bytes()
+    return orjson.loads(raw) if orjson is not None else json.loads(raw)
+
+
+def write_json(path: Path, payload: object, pretty: bool = False) -> None:
+    if orjson is not None:
+        path.write_bytes(orjson.dumps(payload, option=orjson.OPT_INDENT_2 if pretty else None))
+    else:
+        path.write_text(json.dumps(payload, ensure_ascii=False, indent=2 if pretty else None), encoding="utf-8")
 
 
 def load_common_coins(path: Path) -> List[str]:
-    data = json.loads(path.read_text(encoding="utf-8"))
+    data = read_json(path)
     return [coin.upper() for coin in data.get("coins", [])]
 
 
+def isoformat_from_ms(ts_ms: int) -> str:
+    return datetime.fromtimestamp(ts_ms / 1000, tz=UTC).isoformat().replace("+00:00", "Z")
+
+
 def load_coin_history(coin: str) -> Optional[dict]:
     path = HIST_DIR / f"{coin}.json"
-    if not path.exists():
-        return None
-    try:
-        return json.loads(path.read_text(encoding="utf-8"))
-    except json.JSONDecodeError:
+    if not path.exists() or path.stat().st_size == 0:
         return None
+    if orjson is None:
+        try:
+            return read_json(path)
+        except json.JSONDecodeError:
+            return None
+    # Parse straight from the page cache instead of copying the file into a bytes object.
+    with path.open("rb") as handle, mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+        with memoryview(mapped) as view:
+            try:
+                return orjson.loads(view)
+            except orjson.JSONDecodeError:
+                return None
+
+
+def candle_arrays(candles: List[dict]) -> Dict[str, np.ndarray]:
+    count = len(candles)
+    return {
+        "timestamp_ms": np.fromiter((int(c["timestamp_ms"]) for c in candles), dtype=np.int64, count=count),
+        "close": np.fromiter((float(c["close"]) for c in candles), dtype=np.float64, count=count),
+    }
 
 
-def compute_series_metrics(candles: List[dict]) -> Optional[dict]:
-    if len(candles) < 2:
+def load_coin_arrays(coin: str) -> Optional[CoinSeries]:
+    """Load a coin's per-exchange timestamp/close arrays.
+
+    Prefers the columnar `<COIN>.npz` written by fetch_daily_histories.py and
+    falls back to parsing `<COIN>.json` when the archive is missing or older
+    than the JSON history.
+    """
+    json_path = HIST_DIR / f"{coin}.json"
+    npz_path = HIST_DIR / f"{coin}.npz"
+    if npz_path.exists() and (
+        not json_path.exists() or npz_path.stat().st_mtime_ns >= json_path.stat().st_mtime_ns
+    ):
+        try:
+            series: CoinSeries = {}
+            with np.load(npz_path) as archive:
+                for key in archive.files:
+                    exchange, _, field = key.partition(".")
+                    if field in ("timestamp_ms", "close"):
+                        series.setdefault(exchange, {})[field] = archive[key]
+            return series
+        except (OSError, ValueError, zipfile.BadZipFile):
+            pass
+
+    payload = load_coin_history(coin)
+    if not payload:
+        return None
+    exchanges = payload.get("exchanges") or {}
+    return {name: candle_arrays(data.get("candles", [])) for name, data in exchanges.items()}
+
+
+def _rolling_max_deque(values: np.ndarray, window: int) -> np.ndarray:
+    # Monotonic deque of indices whose values are decreasing; the head is the window max.
+    n = values.shape[0]
+    out = np.empty_like(values)
+    queue = np.empty(n, dtype=np.int64)
+    head = 0
+    tail = 0
+    for i in range(n):
+        while head < tail and queue[head] <= i - window:
+            head += 1
+        while head < tail and values[queue[tail - 1]] <= values[i]:
+            tail -= 1
+        queue[tail] = i
+        tail += 1
+        out[i] = values[queue[head]]
+    return out
+
+
+if njit is not None:
+    _rolling_max_deque = njit(cache=True)(_rolling_max_deque)
+
+
+def rolling_max(values: np.ndarray, window: int) -> np.ndarray:
+    """Trailing max over the last `window` values (shorter windows at the start)."""
+    if njit is not None:
+        return _rolling_max_deque(values, window)
+    out = np.empty_like(values)
+    lead = min(window - 1, values.size)
+    out[:lead] = np.maximum.accumulate(values[:lead])
+    if values.size >= window:
+        out[window - 1:] = np.lib.stride_tricks.sliding_window_view(values, window).max(axis=1)
+    return out
+
+
+def _series_kernel(closes: np.ndarray) -> Tuple[float, float, float]:
+    # Single pass: Welford variance of log returns plus running-max drawdown.
+    # Assumes closes[0] > 0, so the running max stays positive.
+    count = 0
+    mean = 0.0
+    m2 = 0.0
+    peak = closes[0]
+    max_drawdown = 0.0
+    for i in range(1, closes.shape[0]):
+        if closes[i - 1] > 0:
+            r = math.log(closes[i] / closes[i - 1])
+            count += 1
+            delta = r - mean
+            mean += delta / count
+            m2 += delta * (r - mean)
+        if closes[i] > peak:
+            peak = closes[i]
+        drawdown = closes[i] / peak - 1
+        if drawdown < max_drawdown:
+            max_drawdown = drawdown
+    volatility = math.sqrt(m2 / count) * math.sqrt(365) if count else 0.0
+    return closes[-1] / closes[0] - 1, volatility, max_drawdown
+
+
+if njit is not None:
+    _series_kernel = njit(cache=True, fastmath=True)(_series_kernel)
+
+
+def _series_stats(closes: np.ndarray) -> Tuple[float, float, float]:
+    if njit is not None:
+        return _series_kernel(closes)
+    cum_return = closes[-1] / closes[0] - 1
+    prev, curr = closes[:-1], closes[1:]
+    valid = prev > 0
+    log_returns = np.log(curr[valid] / prev[valid])
+    volatility = float(log_returns.std(ddof=0)) * math.sqrt(365) if log_returns.size else 0.0
+    running_max = np.maximum.accumulate(closes)
+    max_drawdown = (closes / running_max - 1).min()
+    return cum_return, volatility, max_drawdown
+
+
+def compute_series_metrics(series: Dict[str, np.ndarray]) -> Optional[dict]:
+    timestamps = series["timestamp_ms"]
+    closes = series["close"]
+    if closes.size < 2:
         return None
-    closes = [float(entry["close"]) for entry in candles]
     first_close, last_close = closes[0], closes[-1]
     if first_close <= 0 or last_close <= 0:
         return None
 
-    cum_return = last_close / first_close - 1
-    log_returns = [
-        math.log(closes[i] / closes[i - 1]) for i in range(1, len(closes)) if closes[i - 1] > 0
-    ]
-    volatility = statistics.pstdev(log_returns) * math.sqrt(365) if log_returns else 0.0
-
-    max_price = closes[0]
-    max_drawdown = 0.0
-    for price in closes:
-        max_price = max(max_price, price)
-        if max_price > 0:
-            drawdown = price / max_price - 1
-            max_drawdown = min(max_drawdown, drawdown)
-
-    listing_date = candles[0]["timestamp_iso"]
-    last_date = candles[-1]["timestamp_iso"]
+    cum_return, volatility, max_drawdown = _series_stats(closes)
+    rolling_max_drawdown = float((closes / rolling_max(closes, ROLLING_DRAWDOWN_DAYS) - 1).min())
 
     return {
-        "listing_date": listing_date,
-        "last_date": last_date,
-        "days": len(candles),
-        "cum_return": cum_return,
-        "max_drawdown": max_drawdown,
-        "volatility": volatility,
+        "listing_date": isoformat_from_ms(int(timestamps[0])),
+        "last_date": isoformat_from_ms(int(timestamps[-1])),
+        "days": int(closes.size),
+        "cum_return": float(cum_return),
+        "max_drawdown": float(max_drawdown),
+        "rolling_max_drawdown": rolling_max_drawdown,
+        "volatility": float(volatility),
     }
 
 
-def compute_cross_exchange_spread(exchanges: Dict[str, dict]) -> Tuple[Optional[float], Optional[float]]:
-    per_timestamp: Dict[int, List[float]] = defaultdict(list)
-    for exchange_data in exchanges.values():
-        for candle in exchange_data.get("candles", []):
-            ts = int(candle["timestamp_ms"])
-            per_timestamp[ts].append(float(candle["close"]))
-
-    spreads: List[float] = []
-    absolute_spreads: List[float] = []
-    for closes in per_timestamp.values():
-        if len(closes) < 2:
-            continue
-        max_close = max(closes)
-        min_close = min(closes)
-        mid = (max_close + min_close) / 2 if (max_close + min_close) else 0
-        if mid > 0:
-            spreads.append((max_close - min_close) / mid)
-        absolute_spreads.append(max_close - min_close)
-
-    if not spreads:
+def compute_cross_exchange_spread(exchanges: CoinSeries) -> Tuple[Optional[float], Optional[float]]:
+    if not exchanges:
+        return None, None
+    ts = np.concatenate([data["timestamp_ms"] for data in exchanges.values()])
+    close = np.concatenate([data["close"] for data in exchanges.values()])
+    if ts.size < 2:
         return None, None
-    median_rel = statistics.median(spreads)
-    median_abs = statistics.median(absolute_spreads)
+
+    # Group closes by timestamp: sort, then reduce over each run of equal timestamps.
+    order = np.argsort(ts, kind="stable")
+    ts = ts[order]
+    close = close[order]
+    starts = np.concatenate(([0], np.flatnonzero(np.diff(ts)) + 1))
+    counts = np.diff(np.append(starts, ts.size))
+    max_close = np.maximum.reduceat(close, starts)[counts >= 2]
+    min_close = np.minimum.reduceat(close, starts)[counts >= 2]
+
+    mid = (max_close + min_close) / 2
+    absolute_spreads = max_close - min_close
+    positive = mid > 0
+    if not positive.any():
+        return None, None
+    median_rel = float(np.median(absolute_spreads[positive] / mid[positive]))
+    median_abs = float(np.median(absolute_spreads))
     return median_rel, median_abs
 
 
-def build_coin_metrics(
-    coin: str,
-    payload: dict,
-    exchange_metrics: Dict[str, List[dict]],
-) -> Optional[dict]:
-    exchanges = payload.get("exchanges") or {}
+def build_coin_metrics(coin: str, exchanges: CoinSeries) -> Tuple[Optional[dict], Dict[str, dict]]:
+    """Return the coin's headline metrics and its per-exchange metric entries."""
     if not exchanges:
-        return None
+        return None, {}
 
     primary_exchange = None
     for key in PRIMARY_EXCHANGE_ORDER:
@@ -114,16 +259,16 @@ def build_coin_metrics(
     if not primary_exchange:
         primary_exchange = next(iter(exchanges.keys()))
 
-    primary_candles = exchanges.get(primary_exchange, {}).get("candles", [])
-    series_metrics = compute_series_metrics(primary_candles)
+    series_metrics = compute_series_metrics(exchanges[primary_exchange])
     if not series_metrics:
-        return None
+        return None, {}
 
     # Per-exchange metrics for global aggregation
+    exchange_entries: Dict[str, dict] = {}
     for name, data in exchanges.items():
-        metrics = compute_series_metrics(data.get("candles", []))
+        metrics = compute_series_metrics(data)
         if metrics:
-            exchange_metrics[name].append({"coin": coin, **metrics})
+            exchange_entries[name] = {"coin": coin, **metrics}
 
     median_rel_spread, median_abs_spread = compute_cross_exchange_spread(exchanges)
 
@@ -133,28 +278,114 @@ def build_coin_metrics(
         "median_rel_spread": median_rel_spread,
         "median_abs_spread": median_abs_spread,
         **series_metrics,
-    }
+    }, exchange_entries
+
+
+def history_mtime_ns(coin: str) -> Optional[int]:
+    paths = (HIST_DIR / f"{coin}.json", HIST_DIR / f"{coin}.npz")
+    mtimes = [path.stat().st_mtime_ns for path in paths if path.exists()]
+    return max(mtimes) if mtimes else None
 
 
-def summarize_exchange_metrics(metrics: Dict[str, List[dict]]) -> Dict[str, dict]:
-    summary = {}
-    for name, entries in metrics.items():
-        if not entries:
-            continue
-        summary[name] = {
-            "count": len(entries),
-            "avg_cum_return": statistics.mean(e["cum_return"] for e in entries),
-            "median_drawdown": statistics.median(e["max_drawdown"] for e in entries),
-            "median_volatility": statistics.median(e["volatility"] for e in entries),
+def cache_load(coin: str, mtime_ns: int) -> Optional[Tuple[Optional[dict], Dict[str, dict]]]:
+    path = CACHE_DIR / f"{coin}.json"
+    if not path.exists():
+        return None
+    try:
+        cached = read_json(path)
+    except (OSError, ValueError):
+        return None
+    # Anything that is not a current, well-formed entry is treated as a miss.
+    if not isinstance(cached, dict):
+        return None
+    if cached.get("version") != CACHE_VERSION or cached.get("mtime_ns") != mtime_ns:
+        return None
+    metrics = cached.get("metrics")
+    exchange_entries = cached.get("exchange_entries")
+    if not (metrics is None or isinstance(metrics, dict)) or not isinstance(exchange_entries, dict):
+        return None
+    return metrics, exchange_entries
+
+
+def cache_store(coin: str, mtime_ns: int, metrics: Optional[dict], exchange_entries: Dict[str, dict]) -> None:
+    CACHE_DIR.mkdir(parents=True, exist_ok=True)
+    path = CACHE_DIR / f"{coin}.json"
+    # Workers write concurrently; swap each entry in whole so readers never see a partial file.
+    tmp_path = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+    write_json(
+        tmp_path,
+        {
+            "version": CACHE_VERSION,
+            "mtime_ns": mtime_ns,
+            "metrics": metrics,
+            "exchange_entries": exchange_entries,
+        },
+    )
+    os.replace(tmp_path, path)
+
+
+def process_coin(coin: str, use_cache: bool = True) -> Tuple[Optional[dict], Dict[str, dict]]:
+    """Load and analyse a single coin; runs inside a worker process.
+
+    Results are cached per coin and reused while the history files are unchanged.
+    """
+    mtime_ns = history_mtime_ns(coin)
+    if mtime_ns is None:
+        return None, {}
+    if use_cache:
+        cached = cache_load(coin, mtime_ns)
+        if cached is not None:
+            return cached
+    series = load_coin_arrays(coin)
+    if not series:
+        return None, {}
+    metrics, exchange_entries = build_coin_metrics(coin, series)
+    if use_cache:
+        cache_store(coin, mtime_ns, metrics, exchange_entries)
+    return metrics, exchange_entries
+
+
+def new_exchange_columns() -> Dict[str, list]:
+    return {"coin": [], "cum_return": [], "max_drawdown": [], "volatility": []}
+
+
+def summarize_exchange_metrics(metrics: Dict[str, Dict[str, list]]) -> Dict[str, dict]:
+    return {
+        name: {
+            "count": len(columns["coin"]),
+            "avg_cum_return": float(np.mean(columns["cum_return"])),
+            "median_drawdown": float(np.median(columns["max_drawdown"])),
+            "median_volatility": float(np.median(columns["volatility"])),
         }
-    return summary
+        for name, columns in metrics.items()
+        if columns["coin"]
+    }
 
 
-def build_distribution(data: Iterable[dict], key: str, limit: Optional[int] = None) -> List[dict]:
-    items = sorted(data, key=lambda item: item.get(key, 0))
-    if limit:
-        items = items[:limit]
-    return [{"coin": item["coin"], key: item.get(key, 0)} for item in items]
+def top_k_indices(values: np.ndarray, k: int, descending: bool = False) -> np.ndarray:
+    """Indices of the k smallest (or largest) non-NaN values, ordered, ties broken by position."""
+    candidates = np.flatnonzero(~np.isnan(values))
+    keyed = -values[candidates] if descending else values[candidates]
+    if k < keyed.size:
+        # Everything below the k-th value, then the earliest ties at it, as a stable sort would pick.
+        kth = np.partition(keyed, k - 1)[k - 1]
+        below = np.flatnonzero(keyed < kth)
+        ties = np.flatnonzero(keyed == kth)[: k - below.size]
+        selected = np.concatenate((below, ties))
+        candidates, keyed = candidates[selected], keyed[selected]
+    return candidates[np.lexsort((candidates, keyed))]
+
+
+def build_distribution(
+    values: np.ndarray,
+    coins: List[str],
+    key: str,
+    limit: Optional[int] = None,
+) -> List[dict]:
+    # NaNs are dropped whether or not a limit is given, so the limit only truncates.
+    # With a limit this is a partial selection: O(N + k log k) instead of a full sort.
+    order = top_k_indices(values, limit or values.size)
+    return [{"coin": coins[i], key: float(values[i])} for i in order]
 
 
 def parse_args() -> argparse.Namespace:
@@ -162,6 +393,17 @@ def parse_args() -> argparse.Namespace:
     parser.add_argument("--coins", type=Path, default=COMMON_COINS_PATH, help="Path to common_coins.json")
     parser.add_argument("--hist-dir", type=Path, default=HIST_DIR, help="Directory with per-coin histories")
     parser.add_argument("--output", type=Path, default=OUTPUT_PATH, help="Output JSON path")
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=os.cpu_count(),
+        help="Worker processes for per-coin analytics (default: CPU count)",
+    )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help=f"Recompute every coin instead of reusing {CACHE_DIR}",
+    )
     parser.add_argument("--log-level", default="INFO", choices=["DEBUG", "INFO", "WARNING", "ERROR"])
     return parser.parse_args()
 
@@ -173,40 +415,52 @@ def main() -> int:
         print("No coins found; run scripts/fetch_listed_coins.py first.", flush=True)
         return 1
 
-    exchange_metrics: Dict[str, List[dict]] = defaultdict(list)
+    # Column lists per exchange, e.g. {"binance": {"coin": [...], "cum_return": [...], ...}}.
+    exchange_metrics: Dict[str, Dict[str, list]] = defaultdict(new_exchange_columns)
     per_coin: Dict[str, dict] = {}
 
-    for coin in coins:
-        payload = load_coin_history(coin)
-        if not payload:
-            continue
-        metrics = build_coin_metrics(coin, payload, exchange_metrics)
-        if metrics:
+    with ProcessPoolExecutor(max_workers=args.workers) as executor:
+        results = executor.map(process_coin, coins, repeat(not args.no_cache), chunksize=8)
+        for coin, (metrics, exchange_entries) in zip(coins, results):
+            if not metrics:
+                continue
             per_coin[coin] = metrics
+            for name, entry in exchange_entries.items():
+                columns = exchange_metrics[name]
+                for field, values in columns.items():
+                    values.append(entry[field])
 
     if not per_coin:
         print("No coin metrics generated; ensure daily histories exist.", flush=True)
         return 1
 
+    # One pass over the per-coin dicts; everything below works on the arrays.
     coin_metric_list = list(per_coin.values())
-    top_decliners = sorted(coin_metric_list, key=lambda item: item["cum_return"])[:5]
-    top_gainers = sorted(coin_metric_list, key=lambda item: item["cum_return"], reverse=True)[:5]
-    top_spreads = [
-        item for item in sorted(
-            (m for m in coin_metric_list if m.get("median_rel_spread") is not None),
-            key=lambda itm: itm["median_rel_spread"],
-            reverse=True,
-        )[:10]
-    ]
+    count = len(coin_metric_list)
+    coin_names: List[str] = []
+    returns = np.empty(count)
+    drawdowns = np.empty(count)
+    volatilities = np.empty(count)
+    spreads = np.full(count, np.nan)
+    for i, item in enumerate(coin_metric_list):
+        coin_names.append(item["coin"])
+        returns[i] = item["cum_return"]
+        drawdowns[i] = item["max_drawdown"]
+        volatilities[i] = item["volatility"]
+        if item.get("median_rel_spread") is not None:
+            spreads[i] = item["median_rel_spread"]
+    with_spread = np.flatnonzero(~np.isnan(spreads))
+
+    top_decliners = [coin_metric_list[i] for i in top_k_indices(returns, 5)]
+    top_gainers = [coin_metric_list[i] for i in top_k_indices(returns, 5, descending=True)]
+    top_spreads = [coin_metric_list[i] for i in top_k_indices(spreads, 10, descending=True)]
 
     summary = {
         "coins": len(per_coin),
-        "median_cum_return": statistics.median(item["cum_return"] for item in coin_metric_list),
-        "median_drawdown": statistics.median(item["max_drawdown"] for item in coin_metric_list),
-        "median_volatility": statistics.median(item["volatility"] for item in coin_metric_list),
-        "median_spread": statistics.median(
-            item["median_rel_spread"] for item in coin_metric_list if item.get("median_rel_spread") is not None
-        ),
+        "median_cum_return": float(np.median(returns)),
+        "median_drawdown": float(np.median(drawdowns)),
+        "median_volatility": float(np.median(volatilities)),
+        "median_spread": float(np.median(spreads[with_spread])) if with_spread.size else None,
     }
 
     payload = {
@@ -218,16 +472,14 @@ def main() -> int:
         "top_gainers": top_gainers,
         "top_spreads": top_spreads,
         "exchange_summary": summarize_exchange_metrics(exchange_metrics),
-        "return_distribution": build_distribution(coin_metric_list, "cum_return"),
+        "return_distribution": build_distribution(returns, coin_names, "cum_return"),
         "spread_distribution": [
-            {"coin": item["coin"], "median_rel_spread": item["median_rel_spread"]}
-            for item in coin_metric_list
-            if item.get("median_rel_spread") is not None
+            {"coin": coin_names[i], "median_rel_spread": float(spreads[i])} for i in with_spread
         ],
     }
 
     OUTPUT_DIR.mkdir(parents=True, exist_ok=True)
-    args.output.write_text(json.dumps(payload, ensure_ascii=False, indent=2), encoding="utf-8")
+    write_json(args.output, payload, pretty=True)
     print(f"Wrote {args.output} (coins={len(per_coin)})", flush=True)
     return 0
 
@@ -4,7 +4,8 @@
 The script reads `data/common_coins.json`, resolves an appropriate spot market
 for each coin on the supported exchanges, then fetches every available daily
 candle from the listing date through today. Results are written per-coin under
-`data/daily_histories/<COIN>.json` by default.
+`data/daily_histories/<COIN>.json` by default, alongside a columnar
+`<COIN>.npz` (float64/int64 arrays per exchange) for the analytics script.
 
 Exchanges and data sources:
 * Binance, Bybit, OKX, Upbit → via CCXT (public REST)
@@ -16,24 +17,39 @@ from __future__ import annotations
 import argparse
 import json
 import logging
+import os
 import sys
+import threading
 import time
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
 from dataclasses import dataclass
 from datetime import datetime, timedelta, timezone
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict, Iterable, List, Optional, Sequence, Tuple
-from urllib.error import HTTPError, URLError
-from urllib.parse import urlencode
-from urllib.request import Request, urlopen
+from typing import Deque, Dict, Iterable, List, Optional, Sequence, Tuple
 
 import ccxt  # type: ignore
+import numpy as np
+import requests
 from ccxt.base.errors import BaseError as CCXTError  # type: ignore
+from requests.adapters import HTTPAdapter
+
+try:
+    import orjson
+except ImportError:  # optional: falls back to the stdlib parser
+    orjson = None
 
 UTC = timezone.utc
 DAY_MS = 86_400_000
 USER_AGENT = "does-coin-leave-on-applause/daily-histories (+github.com/sueun-dev)"
 DEFAULT_COINS_FILE = Path("data/common_coins.json")
 DEFAULT_OUTPUT_DIR = Path("data/daily_histories")
+DEFAULT_MARKET_CACHE_DIR = Path("data/_cache")
+DEFAULT_MARKET_CACHE_TTL_S = 24 * 3600
+# Coins whose downloads may be in flight ahead of the one being written.
+COIN_LOOKAHEAD = 8
+ARRAY_FIELDS: Tuple[str, ...] = ("open", "high", "low", "close", "volume")
 
 # Preferred quote currencies per exchange (ordered by priority).
 QUOTE_PRIORITY: Dict[str, Sequence[str]] = {
@@ -57,7 +73,9 @@ class FetchError(RuntimeError):
     """Raised when a market cannot be resolved or data download fails."""
 
 
+@lru_cache(maxsize=100_000)
 def isoformat_from_ms(ts_ms: int) -> str:
+    # Daily candles share UTC-midnight timestamps across exchanges and coins.
     return datetime.fromtimestamp(ts_ms / 1000, tz=UTC).isoformat().replace("+00:00", "Z")
 
 
@@ -65,34 +83,49 @@ def ensure_dir(path: Path) -> None:
     path.mkdir(parents=True, exist_ok=True)
 
 
-def fetch_json(url: str, params: Optional[Dict[str, object]] = None) -> object:
-    """Simple JSON GET helper for Coinbase public endpoints."""
-    if params:
-        query = urlencode({k: v for k, v in params.items() if v is not None})
-        full_url = f"{url}?{query}"
+def parse_json(raw: bytes) -> object:
+    return orjson.loads(raw) if orjson is not None else json.loads(raw)
+
+
+def read_json(path: Path) -> object:
+    return parse_json(path.read_bytes())
+
+
+def write_json(path: Path, payload: object) -> None:
+    if orjson is not None:
+        path.write_bytes(orjson.dumps(payload))
     else:
-        full_url = url
-    request = Request(
-        full_url,
-        headers={
-            "User-Agent": USER_AGENT,
-            "Accept": "application/json",
-        },
+        path.write_text(json.dumps(payload, ensure_ascii=False), encoding="utf-8")
+
+
+def build_session() -> requests.Session:
+    session = requests.Session()
+    session.headers.update(
+        {"User-Agent": USER_AGENT, "Accept": "application/json", "Accept-Encoding": "gzip, deflate"}
     )
+    adapter = HTTPAdapter(pool_connections=4, pool_maxsize=16)
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+
+# Shared keep-alive session so repeated Coinbase calls reuse TCP/TLS connections.
+SESSION = build_session()
+
+
+def fetch_json(url: str, params: Optional[Dict[str, object]] = None) -> object:
+    """Simple JSON GET helper for Coinbase public endpoints."""
     try:
-        with urlopen(request, timeout=30) as response:
-            if response.status != 200:
-                raise FetchError(f"{full_url} returned HTTP {response.status}")
-            payload = response.read()
-    except HTTPError as exc:
-        raise FetchError(f"HTTP error while fetching {full_url}: {exc}") from exc
-    except URLError as exc:
-        raise FetchError(f"Network error while fetching {full_url}: {exc}") from exc
-    return json.loads(payload)
+        response = SESSION.get(url, params=params, timeout=30)
+    except requests.RequestException as exc:
+        raise FetchError(f"Network error while fetching {url}: {exc}") from exc
+    if response.status_code != 200:
+        raise FetchError(f"{response.url} returned HTTP {response.status_code}")
+    return parse_json(response.content)
 
 
 def load_common_coins(path: Path, only: Optional[Sequence[str]] = None) -> List[str]:
-    data = json.loads(path.read_text(encoding="utf-8"))
+    data = read_json(path)
     coins = data.get("coins") or []
     if only:
         want = {coin.upper() for coin in only}
@@ -100,23 +133,15 @@ def load_common_coins(path: Path, only: Optional[Sequence[str]] = None) -> List[
     return [coin.upper() for coin in coins]
 
 
-def normalize_number(value: object) -> str:
-    if isinstance(value, str):
-        return value
-    if isinstance(value, (int, float)):
-        return f"{value}"
-    return str(value)
-
-
 def build_candle(ts_ms: int, open_, high, low, close, volume) -> Dict[str, object]:
     return {
         "timestamp_ms": int(ts_ms),
         "timestamp_iso": isoformat_from_ms(int(ts_ms)),
-        "open": normalize_number(open_),
-        "high": normalize_number(high),
-        "low": normalize_number(low),
-        "close": normalize_number(close),
-        "volume": normalize_number(volume),
+        "open": float(open_),
+        "high": float(high),
+        "low": float(low),
+        "close": float(close),
+        "volume": float(volume),
     }
 
 
@@ -129,9 +154,36 @@ class MarketRef:
     market_id: str  # identifier used for API calls (may differ from symbol)
 
 
+class RateLimiter:
+    """Thread-safe pacing that spaces calls at most `rate` per second apart."""
+
+    def __init__(self, rate: float):
+        self.interval = 1.0 / rate
+        self._lock = threading.Lock()
+        self._next_slot = 0.0
+
+    def wait(self) -> None:
+        with self._lock:
+            now = time.monotonic()
+            slot = max(now, self._next_slot)
+            self._next_slot = slot + self.interval
+        if slot > now:
+            time.sleep(slot - now)
+
+
+def sort_by_quote_priority(market_map: Dict[str, List[MarketRef]], priorities: Sequence[str]) -> None:
+    """Order each base's markets by preferred quote currency, then symbol."""
+    rank = {quote: idx for idx, quote in enumerate(priorities)}
+    fallback = len(priorities)
+    for refs in market_map.values():
+        refs.sort(key=lambda ref: (rank.get(ref.quote, fallback), ref.symbol))
+
+
 class BaseMarketFetcher:
     name: str
     display_name: str
+    # Parallel downloads allowed against this exchange.
+    max_concurrency: int = 1
 
     def prepare(self) -> None:
         raise NotImplementedError
@@ -148,12 +200,20 @@ class BaseMarketFetcher:
 
 
 class CCXTExchangeFetcher(BaseMarketFetcher):
-    def __init__(self, name: str, ccxt_id: str):
+    def __init__(
+        self,
+        name: str,
+        ccxt_id: str,
+        market_cache_dir: Optional[Path] = DEFAULT_MARKET_CACHE_DIR,
+        market_cache_ttl_s: float = DEFAULT_MARKET_CACHE_TTL_S,
+    ):
         self.name = name
         self.display_name = name.capitalize()
         self.ccxt_id = ccxt_id
         self.client: Optional[ccxt.Exchange] = None
         self.market_map: Dict[str, List[MarketRef]] = {}
+        self.market_cache_path = market_cache_dir / f"markets_{ccxt_id}.json" if market_cache_dir else None
+        self.market_cache_ttl_s = market_cache_ttl_s
 
     def prepare(self) -> None:
         if self.client is not None:
@@ -163,7 +223,11 @@ class CCXTExchangeFetcher(BaseMarketFetcher):
             params["options"] = {"defaultType": "spot"}
         exchange_class = getattr(ccxt, self.ccxt_id)
         self.client = exchange_class(params)
-        markets = self.client.load_markets()
+        markets = self._load_cached_markets()
+        if markets is None:
+            # reload=True discards anything a rejected cache may have half-installed.
+            markets = self.client.load_markets(reload=True)
+            self._store_cached_markets()
         for market in markets.values():
             if not market.get("spot", True):
                 continue
@@ -179,15 +243,33 @@ class CCXTExchangeFetcher(BaseMarketFetcher):
                 market_id=market.get("id") or market.get("symbol") or f"{base}/{quote}",
             )
             self.market_map.setdefault(base, []).append(ref)
-        priorities = QUOTE_PRIORITY.get(self.name, ())
-        for base, refs in self.market_map.items():
-            refs.sort(key=lambda ref: (self._priority_index(priorities, ref.quote), ref.symbol))
+        sort_by_quote_priority(self.market_map, QUOTE_PRIORITY.get(self.name, ()))
 
-    def _priority_index(self, priorities: Sequence[str], quote: str) -> int:
+    def _load_cached_markets(self) -> Optional[Dict[str, dict]]:
+        """Install markets from the on-disk cache when it is younger than the TTL."""
+        assert self.client is not None
+        path = self.market_cache_path
+        if path is None or self.market_cache_ttl_s <= 0 or not path.exists():
+            return None
+        if time.time() - path.stat().st_mtime > self.market_cache_ttl_s:
+            return None
         try:
-            return priorities.index(quote)
-        except ValueError:
-            return len(priorities)
+            cached = read_json(path)
+            return self.client.set_markets(cached["markets"], cached.get("currencies"))
+        except (OSError, ValueError, KeyError, TypeError, AttributeError, CCXTError):
+            # Unreadable, wrongly shaped, or written by an incompatible ccxt version:
+            # ignore it and let prepare() reload (and rewrite) the markets.
+            return None
+
+    def _store_cached_markets(self) -> None:
+        assert self.client is not None
+        if self.market_cache_path is None:
+            return
+        ensure_dir(self.market_cache_path.parent)
+        write_json(
+            self.market_cache_path,
+            {"markets": list(self.client.markets.values()), "currencies": self.client.currencies},
+        )
 
     def resolve_market(self, base: str) -> MarketRef:
         self.prepare()
@@ -206,8 +288,9 @@ class CCXTExchangeFetcher(BaseMarketFetcher):
         timeframe = "1d"
         duration_ms = int(self.client.parse_timeframe(timeframe) * 1000)
         since: Optional[int] = since_ms
-        candles: Dict[int, Dict[str, object]] = {}
-        last_ts: Optional[int] = None
+        # CCXT batches arrive in time order; only the seam between batches can overlap.
+        candles: List[Dict[str, object]] = []
+        last_ts = -1
         while True:
             try:
                 batch = self.client.fetch_ohlcv(
@@ -223,34 +306,36 @@ class CCXTExchangeFetcher(BaseMarketFetcher):
             new_points = 0
             for entry in batch:
                 ts = int(entry[0])
-                if last_ts is not None and ts <= last_ts:
+                if ts <= last_ts:
                     continue
-                candles[ts] = build_candle(ts, entry[1], entry[2], entry[3], entry[4], entry[5])
+                candles.append(build_candle(ts, entry[1], entry[2], entry[3], entry[4], entry[5]))
                 new_points += 1
                 last_ts = ts
             if len(batch) < limit or new_points == 0:
                 break
             since = (batch[-1][0] + duration_ms)
-        ordered = [candles[ts] for ts in sorted(candles)]
-        if not ordered:
+        if not candles:
             raise FetchError(f"{self.display_name} returned no data for {market.symbol}")
-        return ordered
+        return candles
 
 
 class CoinbaseFetcher(BaseMarketFetcher):
+    max_concurrency = 2
     PRODUCTS_URL = "https://api.exchange.coinbase.com/products"
     CANDLES_URL_TEMPLATE = "https://api.exchange.coinbase.com/products/{product_id}/candles"
+    REQUESTS_PER_SECOND = 3.0
+    WINDOW_CONCURRENCY = 3
 
     def __init__(self) -> None:
         self.name = "coinbase"
         self.display_name = "Coinbase"
         self.market_map: Dict[str, List[MarketRef]] = {}
+        self.rate_limiter = RateLimiter(self.REQUESTS_PER_SECOND)
 
     def prepare(self) -> None:
         if self.market_map:
             return
         data = fetch_json(self.PRODUCTS_URL)
-        priorities = QUOTE_PRIORITY.get(self.name, ())
         for product in data:
             if product.get("status") != "online":
                 continue
@@ -267,14 +352,7 @@ class CoinbaseFetcher(BaseMarketFetcher):
                 market_id=product_id,
             )
             self.market_map.setdefault(base, []).append(ref)
-        for base, refs in self.market_map.items():
-            refs.sort(key=lambda ref: (self._priority_index(priorities, ref.quote), ref.symbol))
-
-    def _priority_index(self, priorities: Sequence[str], quote: str) -> int:
-        try:
-            return priorities.index(quote)
-        except ValueError:
-            return len(priorities)
+        sort_by_quote_priority(self.market_map, QUOTE_PRIORITY.get(self.name, ()))
 
     def resolve_market(self, base: str) -> MarketRef:
         self.prepare()
@@ -294,37 +372,49 @@ class CoinbaseFetcher(BaseMarketFetcher):
             start = datetime(2015, 1, 1, tzinfo=UTC)
         now = datetime.now(tz=UTC)
         window = timedelta(days=300)
-        candles: Dict[int, Dict[str, object]] = {}
+        windows: List[Tuple[datetime, datetime]] = []
         while start < now:
             end = min(start + window, now)
+            windows.append((start, end))
+            start = end
+        url = self.CANDLES_URL_TEMPLATE.format(product_id=market.market_id)
+
+        def fetch_window(bounds: Tuple[datetime, datetime]) -> object:
             params = {
                 "granularity": 86_400,  # 1 day in seconds
-                "start": start.isoformat().replace("+00:00", "Z"),
-                "end": end.isoformat().replace("+00:00", "Z"),
+                "start": bounds[0].isoformat().replace("+00:00", "Z"),
+                "end": bounds[1].isoformat().replace("+00:00", "Z"),
             }
-            url = self.CANDLES_URL_TEMPLATE.format(product_id=market.market_id)
-            batch = fetch_json(url, params=params)
-            for entry in batch:
-                ts_sec = int(entry[0])
-                ts_ms = ts_sec * 1000
-                low, high, open_, close, volume = entry[1:6]
-                candles[ts_ms] = build_candle(ts_ms, open_, high, low, close, volume)
-            start = end
-            time.sleep(0.2)
+            self.rate_limiter.wait()
+            return fetch_json(url, params=params)
+
+        # Windows are independent, so fetch them concurrently; the shared limiter
+        # keeps the combined request rate within Coinbase's public quota.
+        candles: Dict[int, Dict[str, object]] = {}
+        with ThreadPoolExecutor(max_workers=self.WINDOW_CONCURRENCY) as pool:
+            for batch in pool.map(fetch_window, windows):
+                for entry in batch:
+                    ts_sec = int(entry[0])
+                    ts_ms = ts_sec * 1000
+                    low, high, open_, close, volume = entry[1:6]
+                    candles[ts_ms] = build_candle(ts_ms, open_, high, low, close, volume)
         ordered = [candles[ts] for ts in sorted(candles)]
         if not ordered:
             raise FetchError(f"Coinbase returned no data for {market.symbol}")
         return ordered
 
 
-def build_fetchers(names: Sequence[str]) -> List[BaseMarketFetcher]:
+def build_fetchers(
+    names: Sequence[str],
+    market_cache_ttl_s: float = DEFAULT_MARKET_CACHE_TTL_S,
+) -> List[BaseMarketFetcher]:
     fetchers: List[BaseMarketFetcher] = []
     for name in names:
         key = name.lower()
         if key == "coinbase":
             fetchers.append(CoinbaseFetcher())
         elif key in ("binance", "bybit", "okx", "upbit"):
-            fetchers.append(CCXTExchangeFetcher(key, key))
+            fetchers.append(CCXTExchangeFetcher(key, key, market_cache_ttl_s=market_cache_ttl_s))
         else:
             raise ValueError(f"Unsupported exchange '{name}'")
     return fetchers
@@ -334,7 +424,7 @@ def load_existing_coin(path: Path) -> Optional[Dict[str, object]]:
     if not path.exists():
         return None
     try:
-        return json.loads(path.read_text(encoding="utf-8"))
+        return read_json(path)
     except json.JSONDecodeError:
         return None
 
@@ -345,10 +435,11 @@ def merge_candle_lists(
 ) -> List[Dict[str, object]]:
     if not existing:
         return sorted(new, key=lambda item: int(item["timestamp_ms"]))
-    combined: Dict[int, Dict[str, object]] = {int(item["timestamp_ms"]): item for item in existing}
-    for entry in new:
-        combined[int(entry["timestamp_ms"])] = entry
-    return [combined[key] for key in sorted(combined)]
+    combined = [*existing, *new]
+    timestamps = np.fromiter((int(item["timestamp_ms"]) for item in combined), dtype=np.int64, count=len(combined))
+    # np.unique keeps the first occurrence; scanning in reverse lets `new` win on collisions.
+    _, reversed_idx = np.unique(timestamps[::-1], return_index=True)
+    return [combined[len(combined) - 1 - i] for i in reversed_idx]
 
 
 def serialize_coin_payload(coin: str, markets: Dict[str, Dict[str, object]]) -> Dict[str, object]:
@@ -359,42 +450,115 @@ def serialize_coin_payload(coin: str, markets: Dict[str, Dict[str, object]]) ->
     }
 
 
-def harvest_coin(
+def write_coin_arrays(path: Path, markets: Dict[str, Dict[str, object]]) -> None:
+    """Write per-exchange candle columns as `<exchange>.<field>` arrays in an .npz archive."""
+    arrays: Dict[str, np.ndarray] = {}
+    for exchange, entry in markets.items():
+        candles = entry.get("candles") or []
+        count = len(candles)
+        arrays[f"{exchange}.timestamp_ms"] = np.fromiter(
+            (int(candle["timestamp_ms"]) for candle in candles), dtype=np.int64, count=count
+        )
+        for field in ARRAY_FIELDS:
+            arrays[f"{exchange}.{field}"] = np.fromiter(
+                (float(candle[field]) for candle in candles), dtype=np.float64, count=count
+            )
+    # Write beside the target and swap it in, so an interrupted run never leaves a
+    # truncated archive that looks newer than the JSON history.
+    tmp_path = path.with_name(path.name + ".tmp")
+    with tmp_path.open("wb") as handle:
+        np.savez(handle, **arrays)
+    os.replace(tmp_path, path)
+
+
+def resume_since_ms(existing_exchange: Dict[str, object], incremental: bool) -> Optional[int]:
+    if not incremental or not existing_exchange:
+        return None
+    candles_list = existing_exchange.get("candles") or []
+    if not candles_list:
+        return None
+    return int(candles_list[-1]["timestamp_ms"]) + DAY_MS
+
+
+def download_candles(
+    coin: str,
+    fetcher: BaseMarketFetcher,
+    logger: logging.Logger,
+    since_ms: Optional[int] = None,
+) -> Optional[Tuple[MarketRef, List[Dict[str, object]]]]:
+    """Resolve and download one coin on one exchange; runs on the exchange's worker pool.
+
+    Returns None when the exchange has no market for the coin; download
+    failures propagate as FetchError.
+    """
+    try:
+        market = fetcher.resolve_market(coin)
+    except FetchError as exc:
+        logger.warning("Skipping %s on %s: %s", coin, fetcher.display_name, exc)
+        return None
+    logger.info(
+        "Fetching %s daily candles on %s (%s)%s",
+        coin,
+        fetcher.display_name,
+        market.symbol,
+        f" starting {isoformat_from_ms(since_ms)}" if since_ms else "",
+    )
+    return market, fetcher.fetch_candles(market, since_ms=since_ms)
+
+
+@dataclass
+class CoinJob:
+    index: int
+    coin: str
+    output_path: Path
+    existing_exchanges: Dict[str, Dict[str, object]]
+    downloads: Dict[str, "Future[Optional[Tuple[MarketRef, List[Dict[str, object]]]]]"]
+
+
+def submit_coin(
+    index: int,
     coin: str,
+    output_path: Path,
+    fetchers: Iterable[BaseMarketFetcher],
+    pools: Dict[str, ThreadPoolExecutor],
+    logger: logging.Logger,
+    existing_exchanges: Dict[str, Dict[str, object]],
+    incremental: bool = True,
+) -> CoinJob:
+    downloads = {
+        fetcher.name: pools[fetcher.name].submit(
+            download_candles,
+            coin,
+            fetcher,
+            logger,
+            resume_since_ms(existing_exchanges.get(fetcher.name, {}), incremental),
+        )
+        for fetcher in fetchers
+    }
+    return CoinJob(index, coin, output_path, existing_exchanges, downloads)
+
+
+def harvest_coin(
+    job: CoinJob,
     fetchers: Iterable[BaseMarketFetcher],
     logger: logging.Logger,
-    existing_exchanges: Optional[Dict[str, Dict[str, object]]] = None,
     incremental: bool = True,
 ) -> Dict[str, Dict[str, object]]:
+    coin = job.coin
     results: Dict[str, Dict[str, object]] = {}
     for fetcher in fetchers:
+        existing_exchange = job.existing_exchanges.get(fetcher.name, {})
         try:
-            market = fetcher.resolve_market(coin)
-        except FetchError as exc:
-            logger.warning("Skipping %s on %s: %s", coin, fetcher.display_name, exc)
-            continue
-        existing_exchange = (existing_exchanges or {}).get(fetcher.name, {})
-        since_ms = None
-        if incremental and existing_exchange:
-            candles_list = existing_exchange.get("candles") or []
-            if candles_list:
-                since_ms = int(candles_list[-1]["timestamp_ms"]) + DAY_MS
-
-        logger.info(
-            "Fetching %s daily candles on %s (%s)%s",
-            coin,
-            fetcher.display_name,
-            market.symbol,
-            f" starting {isoformat_from_ms(since_ms)}" if since_ms else "",
-        )
-        try:
-            candles = fetcher.fetch_candles(market, since_ms=since_ms)
+            download = job.downloads[fetcher.name].result()
         except FetchError as exc:
             logger.error("Failed to fetch %s on %s: %s", coin, fetcher.display_name, exc)
             if incremental and existing_exchange:
                 logger.info("Retaining previously stored data for %s on %s", coin, fetcher.display_name)
                 results[fetcher.name] = existing_exchange
             continue
+        if download is None:
+            continue
+        market, candles = download
         if incremental and existing_exchange:
             merged = merge_candle_lists(existing_exchange.get("candles"), candles)
         else:
@@ -411,6 +575,36 @@ def harvest_coin(
     return results
 
 
+def write_coin(
+    job: CoinJob,
+    fetchers: Sequence[BaseMarketFetcher],
+    logger: logging.Logger,
+    full_refresh: bool,
+) -> None:
+    coin = job.coin
+    existing_exchanges = job.existing_exchanges
+    markets = harvest_coin(job, fetchers, logger, incremental=not full_refresh)
+    if not markets and existing_exchanges and not full_refresh:
+        logger.info("No updates for %s; retaining existing dataset", coin)
+        markets = existing_exchanges
+    elif existing_exchanges and not full_refresh:
+        merged_markets = existing_exchanges.copy()
+        merged_markets.update(markets)
+        markets = merged_markets
+    if not markets:
+        logger.warning("No exchange data collected for %s; skipping write", coin)
+        return
+    payload = serialize_coin_payload(coin, markets)
+    write_json(job.output_path, payload)
+    write_coin_arrays(job.output_path.with_suffix(".npz"), markets)
+    logger.info(
+        "Wrote %s with %s exchanges (%d total candles)",
+        job.output_path,
+        ", ".join(sorted(markets.keys())),
+        sum(entry["count"] for entry in markets.values()),
+    )
+
+
 def parse_args(argv: Optional[Sequence[str]] = None) -> argparse.Namespace:
     parser = argparse.ArgumentParser(
         description="Fetch daily OHLCV for coins listed on every exchange.",
@@ -453,6 +647,15 @@ def parse_args(argv: Optional[Sequence[str]] = None) -> argparse.Namespace:
         action="store_true",
         help="Ignore existing files and re-download all history from scratch.",
     )
+    parser.add_argument(
+        "--market-cache-hours",
+        type=float,
+        default=DEFAULT_MARKET_CACHE_TTL_S / 3600,
+        help=(
+            f"Reuse CCXT market metadata cached under {DEFAULT_MARKET_CACHE_DIR} for this many hours "
+            "(default: 24; 0 always reloads)"
+        ),
+    )
     parser.add_argument(
         "--log-level",
         default="INFO",
@@ -484,46 +687,49 @@ def main(argv: Optional[Sequence[str]] = None) -> int:
     if args.max_coins:
         coins = coins[: args.max_coins]
 
-    fetchers = build_fetchers(args.exchanges)
+    fetchers = build_fetchers(args.exchanges, market_cache_ttl_s=args.market_cache_hours * 3600)
     for fetcher in fetchers:
         logger.info("Preparing metadata for %s", fetcher.display_name)
         fetcher.prepare()
 
     ensure_dir(args.output_dir)
     total = len(coins)
-    for idx, coin in enumerate(coins, start=1):
-        output_path = args.output_dir / f"{coin}.json"
-        if args.skip_existing and output_path.exists() and not args.full_refresh:
-            logger.info("Skipping %s (%d/%d) – already exists", coin, idx, total)
-            continue
-        logger.info("Processing %s (%d/%d)", coin, idx, total)
-        existing_payload = None if args.full_refresh else load_existing_coin(output_path)
-        existing_exchanges = (existing_payload or {}).get("exchanges") or {}
-        markets = harvest_coin(
-            coin,
-            fetchers,
-            logger,
-            existing_exchanges=existing_exchanges,
-            incremental=not args.full_refresh,
-        )
-        if not markets and existing_exchanges and not args.full_refresh:
-            logger.info("No updates for %s; retaining existing dataset", coin)
-            markets = existing_exchanges
-        elif existing_exchanges and not args.full_refresh:
-            merged_markets = existing_exchanges.copy()
-            merged_markets.update(markets)
-            markets = merged_markets
-        if not markets:
-            logger.warning("No exchange data collected for %s; skipping write", coin)
-            continue
-        payload = serialize_coin_payload(coin, markets)
-        output_path.write_text(json.dumps(payload, ensure_ascii=False), encoding="utf-8")
-        logger.info(
-            "Wrote %s with %s exchanges (%d total candles)",
-            output_path,
-            ", ".join(sorted(markets.keys())),
-            sum(entry["count"] for entry in markets.values()),
-        )
+    # One pool per exchange so each API keeps its own concurrency budget while
+    # different exchanges download in parallel. Coins are submitted a few ahead
+    # of the writer to bound the amount of history held in memory.
+    pools = {
+        fetcher.name: ThreadPoolExecutor(max_workers=fetcher.max_concurrency, thread_name_prefix=fetcher.name)
+        for fetcher in fetchers
+    }
+    pending: Deque[CoinJob] = deque()
+    try:
+        for idx, coin in enumerate(coins, start=1):
+            output_path = args.output_dir / f"{coin}.json"
+            if args.skip_existing and output_path.exists() and not args.full_refresh:
+                logger.info("Skipping %s (%d/%d) – already exists", coin, idx, total)
+                continue
+            logger.info("Processing %s (%d/%d)", coin, idx, total)
+            existing_payload = None if args.full_refresh else load_existing_coin(output_path)
+            existing_exchanges = (existing_payload or {}).get("exchanges") or {}
+            pending.append(
+                submit_coin(
+                    idx,
+                    coin,
+                    output_path,
+                    fetchers,
+                    pools,
+                    logger,
+                    existing_exchanges,
+                    incremental=not args.full_refresh,
+                )
+            )
+            if len(pending) > COIN_LOOKAHEAD:
+                write_coin(pending.popleft(), fetchers, logger, args.full_refresh)
+        while pending:
+            write_coin(pending.popleft(), fetchers, logger, args.full_refresh)
+    finally:
+        for pool in pools.values():
+            pool.shutdown(wait=True, cancel_futures=True)
     return 0
 
 
@@ -16,20 +16,46 @@ object to stdout or writes it to a file when --output is provided.
 from __future__ import annotations
 
 import argparse
+import hashlib
 import json
 import sys
 import time
 import logging
+import os
+from functools import partial
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, as_completed, wait
+from concurrent.futures import TimeoutError as FuturesTimeoutError
 from pathlib import Path
-from typing import Dict, Iterable, List, Optional, Set
-from urllib.error import HTTPError, URLError
-from urllib.parse import urlencode
-from urllib.request import Request, urlopen
+from typing import Callable, Dict, Iterable, List, Mapping, Optional, Set, Tuple
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+try:
+    import orjson
+except ImportError:  # optional: falls back to the stdlib encoder/decoder
+    orjson = None
+
+try:
+    import msgspec
+except ImportError:  # optional: fastest encoder for the output files
+    msgspec = None
+
+try:
+    import simdjson
+except ImportError:  # optional: lazy parsing of the large listing payloads
+    simdjson = None
 
 DATA_DIR = Path("data")
 DEFAULT_OUTPUT_PATH = DATA_DIR / "listed_coins.json"
 DEFAULT_COMMON_OUTPUT_PATH = DATA_DIR / "common_coins.json"
+# Key in the per-exchange listings output naming exchanges whose list is incomplete.
+PARTIAL_LISTINGS_KEY = "partial_exchanges"
+# Conditional-GET cache: validators and last body per URL, revalidated every run.
+HTTP_CACHE_DIR = DATA_DIR / ".http_cache"
 USER_AGENT = "does-coin-leave-on-applause/coin-lister (+github.com/sueun-dev)"
+REQUEST_TIMEOUT_S = 30.0
 logger = logging.getLogger(__name__)
 BINANCE_URLS = [
     # Public data mirror accessible from most regions.
@@ -42,66 +68,294 @@ BINANCE_URLS = [
     "https://www.binance.com/api/v3/exchangeInfo",
     "https://data.binance.com/api/v3/exchangeInfo",
 ]
+# Hedged mirror requests: start one mirror, and only add a second if the first has
+# not answered within roughly a normal exchangeInfo download (a few MB).
+BINANCE_HEDGE_INITIAL = 1
+BINANCE_HEDGE_DELAY_S = 3.0
+BINANCE_HEDGE_MAX_IN_FLIGHT = 2
+# Pause before each prefetched Bybit page; the fetch overlaps page processing.
+BYBIT_PAGE_DELAY_S = 0.05
 COINBASE_PRODUCTS_URL = "https://api.exchange.coinbase.com/products"
 BYBIT_URL = "https://api.bybit.com/v5/market/instruments-info"
 COINGECKO_BYBIT_TICKERS_URL = (
     "https://api.coingecko.com/api/v3/exchanges/bybit_spot/tickers"
 )
+# ASCII-only uppercase table for CoinGecko's mixed-case bases. Bytes >= 0x80 are
+# left alone, so UTF-8 continuation bytes pass through untouched.
+TO_UPPER = bytes.maketrans(b"abcdefghijklmnopqrstuvwxyz", b"ABCDEFGHIJKLMNOPQRSTUVWXYZ")
+# Minimum pause between CoinGecko pages; longer waits come from its rate-limit headers.
+COINGECKO_MIN_PAUSE_S = 1.0
 UPBIT_MARKETS_URL = "https://api.upbit.com/v1/market/all"
+UPBIT_KRW_PREFIX = "KRW-"
+UPBIT_KRW_PREFIX_LEN = len(UPBIT_KRW_PREFIX)
 OKX_URL = "https://www.okx.com/api/v5/public/instruments"
 
 
+# Built once; msgspec encoders are reusable and skip per-call option handling.
+MSGSPEC_ENCODER = msgspec.json.Encoder() if msgspec is not None else None
+
+
 class FetchError(RuntimeError):
     """Raised when an API request fails or returns malformed data."""
 
 
-def fetch_json(url: str, params: Optional[Dict[str, str]] = None) -> dict | list:
-    """Perform a GET request and parse JSON response."""
-    if params:
-        query = urlencode(params)
-        url_with_query = f"{url}?{query}"
-    else:
-        url_with_query = url
-
-    request = Request(
-        url_with_query,
-        headers={
-            "User-Agent": USER_AGENT,
-            "Accept": "application/json",
-        },
+class PartialListing(list):
+    """Sorted assets from a fetch that stopped early; known to be incomplete."""
+
+
+class BudgetRetry(Retry):
+    """urllib3 Retry that gives up, and never sleeps, past the --budget deadline."""
+
+    def get_backoff_time(self) -> float:
+        backoff = super().get_backoff_time()
+        if _fetch_deadline is None:
+            return backoff
+        return max(0.0, min(backoff, _fetch_deadline - time.monotonic()))
+
+    def is_exhausted(self) -> bool:
+        if _fetch_deadline is not None and time.monotonic() >= _fetch_deadline:
+            return True
+        return super().is_exhausted()
+
+
+def build_session() -> requests.Session:
+    """Create the shared keep-alive session used for every exchange request."""
+    session = requests.Session()
+    # requests inflates gzip/deflate bodies transparently; exchangeInfo-sized
+    # payloads shrink roughly tenfold on the wire.
+    session.headers.update(
+        {"User-Agent": USER_AGENT, "Accept": "application/json", "Accept-Encoding": "gzip, deflate"}
+    )
+    # Retry only transient 5xx responses; unreachable hosts fall through to the
+    # caller (e.g. the next Binance mirror) instead of stalling on repeated timeouts.
+    # 429s are left to the callers' own rate-limit backoff, and Retry-After is
+    # ignored so adapter sleeps stay short; BudgetRetry also clips them to --budget.
+    retry = BudgetRetry(
+        total=3,
+        connect=0,
+        read=0,
+        backoff_factor=0.5,
+        status_forcelist=[500, 502, 503, 504],
+        allowed_methods=["GET"],
+        respect_retry_after_header=False,
+        raise_on_status=False,
+    )
+    adapter = HTTPAdapter(pool_connections=8, pool_maxsize=16, max_retries=retry)
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+
+SESSION = build_session()
+# Monotonic deadline for the whole fetch job, set by gather_all(); None = unbounded.
+_fetch_deadline: Optional[float] = None
+
+
+def _remaining_budget() -> Optional[float]:
+    """Return seconds left in the job budget (None when unbounded).
+
+    Raises FetchError once the budget is spent, so workers abandoned by
+    gather_all() stop at their next request or pause.
+    """
+    if _fetch_deadline is None:
+        return None
+    remaining = _fetch_deadline - time.monotonic()
+    if remaining <= 0:
+        raise FetchError("Fetch time budget exhausted")
+    return remaining
+
+
+def _request_timeout() -> float:
+    """Return the per-request timeout, clipped to what is left of the job budget."""
+    remaining = _remaining_budget()
+    return REQUEST_TIMEOUT_S if remaining is None else min(REQUEST_TIMEOUT_S, remaining)
+
+
+def _pause(seconds: float) -> None:
+    """Sleep for seconds, clipped to what is left of the job budget."""
+    remaining = _remaining_budget()
+    time.sleep(seconds if remaining is None else min(seconds, remaining))
+
+
+def _http_cache_paths(url: str) -> Tuple[Path, Path]:
+    """Return the (body, validators) cache files for a fully-qualified URL."""
+    key = hashlib.sha1(url.encode("utf-8")).hexdigest()
+    return HTTP_CACHE_DIR / f"{key}.body", HTTP_CACHE_DIR / f"{key}.meta.json"
+
+
+def _load_validators(meta_path: Path, body_path: Path) -> Dict[str, str]:
+    """Build If-None-Match / If-Modified-Since headers from a cached response."""
+    if not (meta_path.exists() and body_path.exists()):
+        return {}
+    try:
+        meta = json.loads(meta_path.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return {}
+    headers: Dict[str, str] = {}
+    if meta.get("etag"):
+        headers["If-None-Match"] = meta["etag"]
+    if meta.get("last_modified"):
+        headers["If-Modified-Since"] = meta["last_modified"]
+    return headers
+
+
+def _store_cached_response(
+    meta_path: Path, body_path: Path, response: requests.Response
+) -> None:
+    """Persist a 200 response's body and validators, if it carries any.
+
+    The validators are dropped first and the body is swapped in atomically, so an
+    interrupted write can never pair an ETag with a truncated body.
+    """
+    etag = response.headers.get("ETag")
+    last_modified = response.headers.get("Last-Modified")
+    if not etag and not last_modified:
+        return
+    try:
+        HTTP_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        meta_path.unlink(missing_ok=True)
+        tmp_path = body_path.with_name(body_path.name + ".tmp")
+        tmp_path.write_bytes(response.content)
+        os.replace(tmp_path, body_path)
+        meta_path.write_text(
+            json.dumps({"etag": etag, "last_modified": last_modified}), encoding="utf-8"
+        )
+    except OSError as exc:
+        logger.debug("Could not cache %s: %s", response.url, exc)
+
+
+def _drop_cached_response(meta_path: Path, body_path: Path) -> None:
+    for path in (meta_path, body_path):
+        try:
+            path.unlink(missing_ok=True)
+        except OSError:
+            pass
+
+
+def _decode_json(content: bytes, lazy: bool):
+    if lazy and simdjson is not None:
+        return simdjson.Parser().parse(content)
+    if orjson is not None:
+        return orjson.loads(content)
+    return json.loads(content)
+
+
+def _get(url: str, headers: Dict[str, str]) -> requests.Response:
+    try:
+        return SESSION.get(url, headers=headers, timeout=_request_timeout())
+    except requests.RequestException as exc:
+        raise FetchError(f"Network error while fetching {url}: {exc}") from exc
+
+
+def fetch_json(
+    url: str,
+    params: Optional[Dict[str, str]] = None,
+    lazy: bool = False,
+    with_headers: bool = False,
+):
+    """Perform a GET request and parse JSON response.
+
+    Responses carrying an ETag or Last-Modified header are cached under
+    HTTP_CACHE_DIR and revalidated with a conditional GET; a 304 reuses the
+    cached body, and an unreadable cached body is discarded and refetched.
+    With lazy=True and pysimdjson installed, returns simdjson's on-demand
+    Object/Array proxies, which only materialize the fields that are read.
+    With with_headers=True, returns a (payload, response headers) tuple.
+    """
+    logger.debug("GET %s params=%s", url, params)
+    full_url = requests.Request("GET", url, params=params).prepare().url
+    body_path, meta_path = _http_cache_paths(full_url)
+    response = _get(full_url, _load_validators(meta_path, body_path))
+    if response.status_code == 304:
+        try:
+            content = body_path.read_bytes()
+            payload = _decode_json(content, lazy)
+        except (OSError, ValueError) as exc:
+            logger.warning("Discarding unusable cached body for %s (%s); refetching", url, exc)
+            _drop_cached_response(meta_path, body_path)
+            response = _get(full_url, {})
+        else:
+            logger.debug("GET %s -> 304 Not Modified, reusing %d cached bytes", url, len(content))
+            return (payload, response.headers) if with_headers else payload
+    if response.status_code != 200:
+        raise FetchError(f"HTTP error while fetching {response.url}: HTTP {response.status_code}")
+    content = response.content
+    logger.debug(
+        "GET %s -> %s bytes on the wire (%s), %d bytes decoded",
+        url,
+        response.headers.get("Content-Length", "?"),
+        response.headers.get("Content-Encoding", "identity"),
+        len(content),
     )
-    logger.debug("GET %s", url_with_query)
     try:
-        with urlopen(request, timeout=30) as response:
-            if response.status != 200:
-                raise FetchError(f"{url_with_query} returned status {response.status}")
-            payload = response.read()
-    except HTTPError as exc:
-        raise FetchError(f"HTTP error while fetching {url_with_query}: {exc}") from exc
-    except URLError as exc:
-        raise FetchError(f"Network error while fetching {url_with_query}: {exc}") from exc
-    return json.loads(payload)
+        payload = _decode_json(content, lazy)
+    except ValueError as exc:
+        raise FetchError(f"Malformed JSON from {response.url}: {exc}") from exc
+    _store_cached_response(meta_path, body_path, response)
+    return (payload, response.headers) if with_headers else payload
+
+
+def _finalize(assets: Set[str], normalized: bool = False) -> List[str]:
+    """Return a fetcher's assets uppercased and sorted, ready for intersection.
+
+    normalized=True marks sources whose symbols are already upper-case (the
+    exchanges' own APIs, or CoinGecko after TO_UPPER), skipping the .upper() pass.
+    """
+    if normalized:
+        return sorted(assets)
+    return sorted({asset.upper() for asset in assets})
 
 
 def fetch_binance_assets() -> List[str]:
-    """Return sorted list of Binance spot base assets that are active."""
+    """Return sorted list of Binance spot base assets that are active.
+
+    Mirrors are raced as hedged requests: the first BINANCE_HEDGE_INITIAL start
+    immediately, a failed mirror is replaced at once, and a slow one gets a hedge
+    after BINANCE_HEDGE_DELAY_S seconds. At most BINANCE_HEDGE_MAX_IN_FLIGHT
+    mirrors download at the same time.
+    """
     last_error: Optional[Exception] = None
-    for url in BINANCE_URLS:
+    remaining = iter(BINANCE_URLS)
+    executor = ThreadPoolExecutor(max_workers=BINANCE_HEDGE_MAX_IN_FLIGHT)
+    pending: Dict[Future, str] = {}
+
+    def launch_next() -> bool:
+        url = next(remaining, None)
+        if url is None:
+            return False
         log_exchange("binance", f"Requesting exchangeInfo from {url}")
-        try:
-            data = fetch_json(url)
-        except FetchError as exc:
-            last_error = exc
-            log_exchange("binance", f"Endpoint {url} failed ({exc}); trying next", logging.WARNING)
-            continue
-        symbols = data.get("symbols", [])
-        assets = {
-            symbol["baseAsset"]
-            for symbol in symbols
-            if symbol.get("status") == "TRADING" and "baseAsset" in symbol
-        }
-        log_exchange("binance", f"Fetched {len(assets)} unique base assets from {url}")
-        return sorted(assets)
+        pending[executor.submit(fetch_json, url, lazy=True)] = url
+        return True
+
+    try:
+        for _ in range(BINANCE_HEDGE_INITIAL):
+            launch_next()
+        while pending:
+            done, _ = wait(pending, timeout=BINANCE_HEDGE_DELAY_S, return_when=FIRST_COMPLETED)
+            if not done:
+                if len(pending) < BINANCE_HEDGE_MAX_IN_FLIGHT:
+                    launch_next()
+                continue
+            for future in done:
+                url = pending.pop(future)
+                try:
+                    data = future.result()
+                except FetchError as exc:
+                    last_error = exc
+                    log_exchange("binance", f"Endpoint {url} failed ({exc}); trying next", logging.WARNING)
+                    launch_next()
+                    continue
+                symbols = data.get("symbols", [])
+                assets = {
+                    symbol["baseAsset"]
+                    for symbol in symbols
+                    if symbol.get("status") == "TRADING" and "baseAsset" in symbol
+                }
+                log_exchange("binance", f"Fetched {len(assets)} unique base assets from {url}")
+                return _finalize(assets, normalized=True)
+    finally:
+        # Slower mirrors still in flight are abandoned rather than awaited.
+        executor.shutdown(wait=False, cancel_futures=True)
     raise FetchError(f"Binance exchangeInfo failed for all endpoints: {last_error}")
 
 
@@ -115,11 +369,16 @@ def fetch_coinbase_assets() -> List[str]:
         if product.get("status") == "online" and "base_currency" in product
     }
     log_exchange("coinbase", f"Fetched {len(assets)} base assets")
-    return sorted(assets)
+    return _finalize(assets, normalized=True)
+
 
+def fetch_bybit_assets(candidates: Optional[Callable[[], Optional[Set[str]]]] = None) -> List[str]:
+    """Return sorted base coins from Bybit spot instruments.
 
-def fetch_bybit_assets() -> List[str]:
-    """Return sorted base coins from Bybit spot instruments."""
+    candidates, when given, is only called if the CoinGecko fallback is needed and
+    returns the coins listed on every other exchange (or None if unknown); the
+    crawl then stops once all of them have been seen on Bybit.
+    """
     errors: List[str] = []
     try:
         log_exchange("bybit", "Attempting native Bybit API (v5)")
@@ -129,7 +388,7 @@ def fetch_bybit_assets() -> List[str]:
         log_exchange("bybit", f"Native API failed ({exc}); falling back to CoinGecko", logging.WARNING)
     try:
         log_exchange("bybit", "Attempting CoinGecko Bybit spot fallback")
-        return _fetch_bybit_via_coingecko()
+        return _fetch_bybit_via_coingecko(candidates=candidates() if candidates else None)
     except FetchError as exc:
         errors.append(f"CoinGecko fallback failed: {exc}")
         raise FetchError("; ".join(errors)) from exc
@@ -137,39 +396,58 @@ def fetch_bybit_assets() -> List[str]:
 
 def _fetch_bybit_native() -> List[str]:
     assets: Set[str] = set()
-    cursor: Optional[str] = None
-    page = 1
-    while True:
+    assets_add = assets.add
+
+    def request_page(page: int, cursor: Optional[str]) -> dict:
         params = {"category": "spot"}
         if cursor:
             params["cursor"] = cursor
         log_exchange("bybit", f"Native API request page {page} (cursor={cursor})", logging.DEBUG)
-        response = fetch_json(BYBIT_URL, params=params)
-        result = response.get("result") or {}
-        instrument_list: List[dict] = list(result.get("list") or [])
-        for instrument in instrument_list:
-            if instrument.get("status") == "Trading" and instrument.get("baseCoin"):
-                assets.add(instrument["baseCoin"])
-        cursor = result.get("nextPageCursor")
-        log_exchange(
-            "bybit",
-            f"Page {page} returned {len(instrument_list)} instruments; accumulated {len(assets)} assets",
-            logging.DEBUG,
-        )
-        if not cursor:
-            break
-        time.sleep(0.2)  # polite pause for subsequent paged calls
-        page += 1
+        return fetch_json(BYBIT_URL, params=params, lazy=True)
+
+    # Double-buffered paging: as soon as a page yields its cursor, the next page is
+    # requested in the background while the current one is merged.
+    with ThreadPoolExecutor(max_workers=1) as prefetcher:
+        page = 1
+        next_page: Optional[Future] = prefetcher.submit(request_page, page, None)
+        while next_page is not None:
+            response = next_page.result()
+            result = response.get("result") or {}
+            cursor = result.get("nextPageCursor")
+            next_page = None
+            if cursor:
+                _pause(BYBIT_PAGE_DELAY_S)  # polite pause for subsequent paged calls
+                next_page = prefetcher.submit(request_page, page + 1, cursor)
+            count = 0
+            for instrument in result.get("list") or []:
+                count += 1
+                if instrument.get("status") == "Trading" and instrument.get("baseCoin"):
+                    assets_add(instrument["baseCoin"])
+            log_exchange(
+                "bybit",
+                f"Page {page} returned {count} instruments; accumulated {len(assets)} assets",
+                logging.DEBUG,
+            )
+            page += 1
     log_exchange("bybit", f"Native API succeeded with {len(assets)} assets")
-    return sorted(assets)
+    return _finalize(assets)
+
 
+def _fetch_bybit_via_coingecko(
+    max_pages: int = 50, candidates: Optional[Set[str]] = None
+) -> List[str]:
+    """Fallback path: use CoinGecko's Bybit spot tickers to infer coin list.
 
-def _fetch_bybit_via_coingecko(max_pages: int = 50) -> List[str]:
-    """Fallback path: use CoinGecko's Bybit spot tickers to infer coin list."""
+    With candidates, paging stops as soon as every candidate has been seen; the
+    result then covers the common-coin intersection but is returned as a
+    PartialListing, since later pages were never read.
+    """
+    stopped_early = False
     assets: Set[str] = set()
+    assets_add = assets.add
     for page in range(1, max_pages + 1):
         log_exchange("bybit", f"CoinGecko fallback requesting page {page}", logging.DEBUG)
-        data = _fetch_coingecko_with_retry(page)
+        data, headers = _fetch_coingecko_with_retry(page)
         tickers: Iterable[dict] = data.get("tickers") or []
         if not tickers:
             if page == 1 and not assets:
@@ -178,25 +456,54 @@ def _fetch_bybit_via_coingecko(max_pages: int = 50) -> List[str]:
         for ticker in tickers:
             base = ticker.get("base")
             if base:
-                assets.add(base.upper())
+                assets_add(base.encode("utf-8").translate(TO_UPPER).decode("utf-8"))
         log_exchange(
             "bybit",
             f"CoinGecko page {page} yielded {len(tickers)} tickers; accumulated {len(assets)} assets",
             logging.DEBUG,
         )
-        time.sleep(10.0)  # respect CoinGecko's stricter anonymous rate limits
+        if candidates is not None and candidates <= assets:
+            log_exchange(
+                "bybit",
+                f"CoinGecko page {page} covered all {len(candidates)} candidate coins; "
+                "stopping early, so the Bybit listing will be partial",
+                logging.WARNING,
+            )
+            stopped_early = True
+            break
+        _pause(_coingecko_pause(headers))
     if not assets:
         raise FetchError("CoinGecko returned an empty Bybit spot asset set")
     log_exchange("bybit", f"CoinGecko fallback succeeded with {len(assets)} assets", logging.INFO)
-    return sorted(assets)
+    listing = _finalize(assets, normalized=True)
+    return PartialListing(listing) if stopped_early else listing
 
 
-def _fetch_coingecko_with_retry(page: int, retries: int = 6) -> dict:
+def _coingecko_pause(headers: Mapping[str, str]) -> float:
+    """Seconds to wait before the next CoinGecko page, based on its rate-limit headers."""
+    pause = COINGECKO_MIN_PAUSE_S
+    try:
+        retry_after = headers.get("Retry-After")
+        if retry_after:
+            pause = max(pause, float(retry_after))
+        remaining = headers.get("X-RateLimit-Remaining")
+        reset = headers.get("X-RateLimit-Reset")
+        if remaining is not None and reset and int(remaining) <= 0:
+            reset_s = float(reset)
+            # Accept either an epoch timestamp or a relative number of seconds.
+            wait_s = reset_s - time.time() if reset_s > 1e9 else reset_s
+            pause = max(pause, wait_s)
+    except ValueError:
+        pass
+    return pause
+
+
+def _fetch_coingecko_with_retry(page: int, retries: int = 6) -> Tuple[dict, Mapping[str, str]]:
     params = {"page": page}
     backoff = 10.0
     for attempt in range(retries):
         try:
-            return fetch_json(COINGECKO_BYBIT_TICKERS_URL, params=params)
+            return fetch_json(COINGECKO_BYBIT_TICKERS_URL, params=params, with_headers=True)
         except FetchError as exc:
             message = str(exc)
             if "429" in message and attempt < retries - 1:
@@ -206,7 +513,7 @@ def _fetch_coingecko_with_retry(page: int, retries: int = 6) -> dict:
                     f"(attempt {attempt + 1}/{retries})",
                     logging.WARNING,
                 )
-                time.sleep(backoff)
+                _pause(backoff)
                 backoff = min(backoff * 1.5, 30.0)
                 continue
             raise
@@ -217,27 +524,26 @@ def fetch_upbit_krw_assets() -> List[str]:
     log_exchange("upbit_krw", "Requesting full market list")
     markets = fetch_json(UPBIT_MARKETS_URL)
     assets = {
-        entry["market"].split("-")[1]
+        market[UPBIT_KRW_PREFIX_LEN:].partition("-")[0]
         for entry in markets
-        if entry.get("market", "").startswith("KRW-")
+        if (market := entry.get("market", "")).startswith(UPBIT_KRW_PREFIX)
     }
     log_exchange("upbit_krw", f"Fetched {len(assets)} KRW-market coins")
-    return sorted(assets)
+    return _finalize(assets, normalized=True)
 
 
 def fetch_okx_assets() -> List[str]:
     """Return sorted base currencies from OKX spot instruments."""
     params = {"instType": "SPOT"}
     log_exchange("okx", "Requesting spot instrument list")
-    response = fetch_json(OKX_URL, params=params)
-    instruments: Iterable[dict] = response.get("data") or []
+    response = fetch_json(OKX_URL, params=params, lazy=True)
     assets = {
         instrument["baseCcy"]
-        for instrument in instruments
+        for instrument in response.get("data") or []
         if instrument.get("state") == "live" and instrument.get("baseCcy")
     }
     log_exchange("okx", f"Fetched {len(assets)} live spot assets")
-    return sorted(assets)
+    return _finalize(assets, normalized=True)
 
 
 EXCHANGE_FETCHERS = {
@@ -261,18 +567,48 @@ def log_exchange(name: str, message: str, level: int = logging.INFO) -> None:
     logger.log(level, "[%s] %s", label, message)
 
 
+def _fast_dumps(payload: object, indent: int) -> Optional[bytes]:
+    """Encode with msgspec or orjson when they match the stdlib layout, else None.
+
+    For the string/int payloads written here, msgspec's formatter matches
+    json.dumps for any positive indent (floats would differ, e.g. 1e16 vs 1e+16);
+    orjson only supports two-space indents.
+    """
+    if MSGSPEC_ENCODER is not None and indent > 0:
+        return msgspec.json.format(MSGSPEC_ENCODER.encode(payload), indent=indent)
+    if orjson is not None and indent == 2:
+        return orjson.dumps(payload, option=orjson.OPT_INDENT_2)
+    return None
+
+
+def dump_json(payload: object, indent: int) -> bytes:
+    """Serialize payload to UTF-8 JSON, preferring msgspec, then orjson."""
+    encoded = _fast_dumps(payload, indent)
+    if encoded is not None:
+        return encoded
+    return json.dumps(payload, ensure_ascii=False, indent=indent).encode("utf-8")
+
+
 def write_json_file(path: Path, payload: object, indent: int) -> None:
     """Write payload as JSON to path, creating directories as needed."""
     path.parent.mkdir(parents=True, exist_ok=True)
-    serialized = json.dumps(payload, ensure_ascii=False, indent=indent)
-    path.write_text(serialized, encoding="utf-8")
-    logger.info("Wrote %s (%d bytes)", path, path.stat().st_size)
+    encoded = _fast_dumps(payload, indent)
+    if encoded is not None:
+        with path.open("wb") as handle:
+            handle.write(encoded)
+        size = len(encoded)
+    else:
+        # Stream straight to the file instead of building the whole string first.
+        with path.open("w", encoding="utf-8") as handle:
+            json.dump(payload, handle, ensure_ascii=False, indent=indent)
+            size = handle.tell()  # byte offset of a write-only UTF-8 stream
+    logger.info("Wrote %s (%d bytes)", path, size)
 
 
 def emit_json(path: Path, payload: object, indent: int, label: str) -> None:
     """Write payload either to stdout (when path == '-') or to disk."""
     if str(path) == "-":
-        print(json.dumps(payload, ensure_ascii=False, indent=indent))
+        print(dump_json(payload, indent).decode("utf-8"))
         logger.info("Wrote %s to stdout", label)
     else:
         write_json_file(path, payload, indent)
@@ -280,36 +616,113 @@ def emit_json(path: Path, payload: object, indent: int, label: str) -> None:
 
 def compute_common_coins(listings: Dict[str, List[str]]) -> List[str]:
     """Return sorted list of coins present on every exchange."""
-    sets: List[Set[str]] = []
+    if not listings:
+        return []
     for name, coins in listings.items():
-        asset_set = {coin.upper() for coin in coins}
-        if not asset_set:
+        if not coins:
             logger.warning(
                 "[%s] No assets found; common coin set will be empty", EXCHANGE_LABELS.get(name, name)
             )
             return []
-        sets.append(asset_set)
-    if not sets:
-        return []
-    common = set.intersection(*sets)
-    logger.info("Computed %d coins that are listed on all %d exchanges", len(common), len(sets))
+    # Fetchers already return uppercased listings (see _finalize). Seed with the
+    # smallest one; the running intersection can only shrink.
+    ordered = sorted(listings.values(), key=len)
+    common = set(ordered[0])
+    for coins in ordered[1:]:
+        common.intersection_update(coins)
+        if not common:
+            break
+    logger.info("Computed %d coins that are listed on all %d exchanges", len(common), len(ordered))
     return sorted(common)
 
 
-def gather_all() -> Dict[str, List[str]]:
-    """Fetch assets for each exchange and return a combined mapping."""
+def gather_all(budget_s: Optional[float] = None) -> Dict[str, List[str]]:
+    """Fetch assets for every exchange concurrently and return a combined mapping.
+
+    With budget_s set, exchanges that have not finished within that many seconds
+    are reported as failures. Every request timeout and pause is clipped to the
+    budget, so their workers wind down by the deadline and are joined here.
+    """
+    global _fetch_deadline
+    _fetch_deadline = time.monotonic() + budget_s if budget_s else None
     results: Dict[str, List[str]] = {}
-    for name, fetcher in EXCHANGE_FETCHERS.items():
-        log_exchange(name, "Starting fetch")
-        start = time.time()
-        assets = fetcher()
-        duration = time.time() - start
-        log_exchange(
-            name,
-            f"Completed fetch: {len(assets)} assets (took {duration:.1f}s)",
-        )
-        results[name] = assets
-    return results
+    errors: List[str] = []
+    executor = ThreadPoolExecutor(max_workers=len(EXCHANGE_FETCHERS))
+    try:
+        others = {
+            executor.submit(_timed_fetch, name, fetcher): name
+            for name, fetcher in EXCHANGE_FETCHERS.items()
+            if name != "bybit"
+        }
+        futures = dict(others)
+        if "bybit" in EXCHANGE_FETCHERS:
+            # Should Bybit need its slow CoinGecko fallback, it waits for the other
+            # exchanges and only crawls until their common coins are covered.
+            candidates = partial(_listing_intersection, list(others))
+            bybit = partial(EXCHANGE_FETCHERS["bybit"], candidates=candidates)
+            futures[executor.submit(_timed_fetch, "bybit", bybit)] = "bybit"
+        handled: Set[Future] = set()
+
+        def collect(future: Future) -> None:
+            name = futures[future]
+            handled.add(future)
+            try:
+                results[name] = future.result()
+            except FetchError as exc:
+                log_exchange(name, f"Fetch failed: {exc}", logging.ERROR)
+                errors.append(f"{EXCHANGE_LABELS.get(name, name)}: {exc}")
+
+        try:
+            for future in as_completed(futures, timeout=budget_s or None):
+                collect(future)
+        except FuturesTimeoutError:
+            # Fetches may finish between the timeout firing and this check; those
+            # still count, and only the truly unfinished ones are timed out.
+            for future, name in futures.items():
+                if future in handled:
+                    continue
+                if future.done():
+                    collect(future)
+                else:
+                    log_exchange(name, f"Fetch timed out after {budget_s:g}s", logging.ERROR)
+                    errors.append(f"{EXCHANGE_LABELS.get(name, name)}: timed out after {budget_s:g}s")
+    finally:
+        executor.shutdown(wait=True, cancel_futures=True)
+        _fetch_deadline = None
+    if errors:
+        raise FetchError("; ".join(errors))
+    # Keep the declared exchange order regardless of completion order.
+    return {name: results[name] for name in EXCHANGE_FETCHERS}
+
+
+def _listing_intersection(futures: List[Future]) -> Optional[Set[str]]:
+    """Wait for the given fetches and intersect their listings.
+
+    Returns None if any of them failed or did not finish within the job budget.
+    """
+    common: Optional[Set[str]] = None
+    for future in futures:
+        try:
+            assets = future.result(timeout=_remaining_budget())
+        except (FetchError, FuturesTimeoutError):
+            return None
+        if common is None:
+            common = set(assets)
+        else:
+            common.intersection_update(assets)
+    return common
+
+
+def _timed_fetch(name: str, fetcher: Callable[[], List[str]]) -> List[str]:
+    log_exchange(name, "Starting fetch")
+    start = time.time()
+    assets = fetcher()
+    duration = time.time() - start
+    log_exchange(
+        name,
+        f"Completed fetch: {len(assets)} assets (took {duration:.1f}s)",
+    )
+    return assets
 
 
 def parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
@@ -343,6 +756,12 @@ def parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
         action="store_true",
         help="Skip writing the all-exchange common coin list.",
     )
+    parser.add_argument(
+        "--budget",
+        type=float,
+        default=0,
+        help="Overall time budget in seconds for fetching every exchange (default: 0, unbounded).",
+    )
     parser.add_argument(
         "--log-level",
         default="INFO",
@@ -361,29 +780,42 @@ def main(argv: Optional[List[str]] = None) -> int:
     )
     logger.debug("Initialized logger at level %s", args.log_level.upper())
     try:
-        payload = gather_all()
+        payload = gather_all(args.budget)
     except FetchError as exc:
         print(f"Error: {exc}", file=sys.stderr)
         return 1
 
-    emit_json(args.output, payload, args.indent, "per-exchange listings")
+    # File writes run in the background so the intersection overlaps disk I/O.
+    # Stdout stays inline to keep the two documents in order.
+    with ThreadPoolExecutor(max_workers=2) as writer:
+        writes: List[Future] = []
 
-    if args.skip_common_output:
-        logger.info("Skipping common coin output per --skip-common-output flag")
-        return 0
+        def schedule(path: Path, data: object, label: str) -> None:
+            if str(path) == "-":
+                emit_json(path, data, args.indent, label)
+            else:
+                writes.append(writer.submit(emit_json, path, data, args.indent, label))
 
-    common_coins = compute_common_coins(payload)
-    common_payload = {
-        "count": len(common_coins),
-        "exchanges": sorted(payload.keys()),
-        "coins": common_coins,
-    }
-    emit_json(
-        args.common_output,
-        common_payload,
-        args.indent,
-        "coins listed on every exchange",
-    )
+        listings: Dict[str, object] = {name: list(coins) for name, coins in payload.items()}
+        partial_names = [name for name, coins in payload.items() if isinstance(coins, PartialListing)]
+        if partial_names:
+            logger.warning(
+                "Listings for %s are partial; see %s in the output", ", ".join(partial_names), PARTIAL_LISTINGS_KEY
+            )
+            listings[PARTIAL_LISTINGS_KEY] = partial_names
+        schedule(args.output, listings, "per-exchange listings")
+        if args.skip_common_output:
+            logger.info("Skipping common coin output per --skip-common-output flag")
+        else:
+            common_coins = compute_common_coins(payload)
+            common_payload = {
+                "count": len(common_coins),
+                "exchanges": sorted(payload.keys()),
+                "coins": common_coins,
+            }
+            schedule(args.common_output, common_payload, "coins listed on every exchange")
+        for write in writes:
+            write.result()
     return 0
 
 